@@ -2088,7 +2088,7 @@ async def usb_keyboard_emulation(enable):
     # no USB switching at this point
     # - need to force reload of main menu, so it shows/hides
     new_top_menu = make_top_menu()
-    the_ux.stack[0] = new_top_menu  # top menu is always element 0
+    the_ux.set_bottom(new_top_menu)  # top menu is always element 0
 
 async def change_nfc_enable(enable):
     # NFC enable / disable
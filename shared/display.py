@@ -297,11 +297,13 @@ class Display:
 
         self.show()
 
-    def draw_story(self, lines, top, num_lines, is_sensitive, **ignored):
+    def draw_story(self, lines, top, height, num_lines, is_sensitive, **ignored):
+        # show lines[top:top+height], without making that slice
         self.clear()
 
         y=0
-        for ln in lines:
+        for i in range(top, min(top+height, num_lines)):
+            ln = lines[i]
             if ln == 'EOT':
                 self.hline(y+3)
             elif ln and ln[0] == '\x01':
@@ -608,11 +608,13 @@ class Display:
 
         self.show()
 
-    def draw_story(self, lines, top, num_lines, is_sensitive, hint_icons=''):
+    def draw_story(self, lines, top, height, num_lines, is_sensitive, hint_icons=''):
+        # show lines[top:top+height], without making that slice
         self.clear()
 
         y=0
-        for ln in lines:
+        for i in range(top, min(top+height, num_lines)):
+            ln = lines[i]
             if ln == 'EOT':
                 self.text(0, y, '┅'*CHARS_W, dark=True)
                 continue
@@ -47,6 +47,7 @@ freeze_as_mpy('', [
 	'utils.py',
 	'ux.py',
 	'version.py',
+	'wrapcount.py',
 	'xor_seed.py',
 	'tapsigner.py',
 	'wallet.py',
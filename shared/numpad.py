@@ -4,6 +4,7 @@
 #
 import utime, uasyncio
 from queues import Queue
+from exceptions import AbortInteraction
 
 class NumpadBase:
 
@@ -32,6 +33,20 @@ class NumpadBase:
     def empty(self):
         return self._changes.empty()
 
+    def next_press(self):
+        # First key press (not release) waiting in queue, or None. Doesn't remove it.
+        return self._changes.find(bool)
+
+    def drain(self):
+        # Discard all pending events. Returns True if ABORT_KEY was among them.
+        q = self._changes
+        aborted = False
+        for _ in range(q.qsize()):
+            if q.get_nowait() == self.ABORT_KEY:
+                aborted = True
+
+        return aborted
+
     def abort_ux(self):
         # pretend a key was pressed, in order to unblock things
         self.inject(self.ABORT_KEY)
@@ -66,4 +81,25 @@ class NumpadBase:
 
         self.last_event_time = utime.ticks_ms()
 
+class NumpadEvents:
+    # Async iterator over keypad events: sleeps until something is queued,
+    # rather than polling the queue. Raises AbortInteraction on ABORT_KEY.
+    #
+    #   async for ch in NumpadEvents(numpad):
+    #       ...
+    #
+    def __init__(self, numpad):
+        self.numpad = numpad
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        ch = await self.numpad.get()
+
+        if ch == self.numpad.ABORT_KEY:
+            raise AbortInteraction()
+
+        return ch
+
 # EOF
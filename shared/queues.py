@@ -68,6 +68,13 @@ class Queue:
             raise QueueFull()
         self._put(val)
 
+    def find(self, pred):  # First item where pred(item) is true, else None. Not removed.
+        # (not in upstream: added for numpad.next_press)
+        for val in self._queue:
+            if pred(val):
+                return val
+        return None
+
     def qsize(self):  # Number of items in the queue.
         return len(self._queue)
 
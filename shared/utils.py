@@ -505,6 +505,21 @@ def word_wrap(ln, w):
 
         yield left
 
+try:
+    # native code, needs a build with a MicroPython native emitter
+    from wrapcount import wrap_count as _wrap_count
+except (ImportError, SyntaxError):
+    _wrap_count = None
+
+def word_wrap_count(ln, w):
+    # How many lines word_wrap(ln, w) will make, without making them.
+    #  - tests in testing/test_unit.py
+    rv = _wrap_count(ln, len(ln), w) if _wrap_count else -1
+    if rv < 0:
+        rv = sum(1 for _ in word_wrap(ln, w))
+
+    return rv
+
 def parse_addr_fmt_str(addr_fmt):
     # accepts strings and also integers if already parsed
     from public_constants import AF_CLASSIC, AF_P2WPKH, AF_P2WPKH_P2SH
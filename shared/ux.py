@@ -4,75 +4,129 @@
 #
 from uasyncio import sleep_ms
 from queues import QueueEmpty
-import utime, gc, version
-from utils import word_wrap
+import utime, gc, version, array
+from utils import word_wrap, word_wrap_count
 from charcodes import (KEY_LEFT, KEY_RIGHT, KEY_UP, KEY_DOWN, KEY_HOME, KEY_NFC, KEY_QR,
                         KEY_END, KEY_PAGE_UP, KEY_PAGE_DOWN, KEY_ENTER, KEY_CANCEL)
 from exceptions import AbortInteraction
 
 DEFAULT_IDLE_TIMEOUT = const(4*3600)      # (seconds) 4 hours
+IDLE_RECHECK = const(5000)                # (ms) longest idle_logout sleeps w/o re-reading setting
+LOW_MEM_FREE = const(32*1024)             # (bytes) worth a gc.collect() when below
 
 # See ux_mk or ux_q1 for some display functions now
 if version.has_qwerty:
     from lcd_display import CHARS_W, CHARS_H
     CH_PER_W = CHARS_W
     STORY_H = CHARS_H
+    TITLE_PAD = ['']        # big screen always needs blank after title
     from ux_q1 import PressRelease, ux_enter_number, ux_input_numbers, ux_input_text, ux_show_pin
     from ux_q1 import ux_login_countdown, ux_confirm, ux_dice_rolling, ux_render_words
     from ux_q1 import ux_show_phish_words
 
     def q1_reword(msg):
-        return msg.replace('\nX ', 'CANCEL ').replace(' X ', ' CANCEL ').replace('OK', 'ENTER')
+        # Rename Mk4 keys for the Q1 keyboard, in a single pass:
+        #   '\nX ' => 'CANCEL ', ' X ' => ' CANCEL ', 'OK' => 'ENTER'
+        # - same result as chaining those three str.replace() calls
+        # - returns msg itself if nothing to change
+        parts = []
+        pos = 0         # start of text not yet copied
+        used = -1       # space already consumed as tail of a ' X ' match
+
+        x = msg.find('X ')
+        k = msg.find('OK')
+        while x >= 0 or k >= 0:
+            if k >= 0 and (x < 0 or k < x):
+                parts.append(msg[pos:k])
+                parts.append('ENTER')
+                pos = k + 2
+                k = msg.find('OK', pos)
+                continue
+
+            before = msg[x-1:x] if x else ''
+            if before == '\n':
+                parts.append(msg[pos:x-1])
+                parts.append('CANCEL ')
+                pos = x + 2
+            elif before == ' ' and x-1 != used:
+                parts.append(msg[pos:x])
+                parts.append('CANCEL ')
+                pos = x + 2
+                used = x + 1
+
+            x = msg.find('X ', x+1)
+
+        if not parts:
+            return msg
+
+        parts.append(msg[pos:])
+        return ''.join(parts)
 else:
     # How many characters can we fit on each line? How many lines?
     # (using FontSmall)
     CH_PER_W = 17
     STORY_H = 5
+    TITLE_PAD = []
     from ux_mk4 import PressRelease, ux_enter_number, ux_input_numbers, ux_input_text, ux_show_pin
     from ux_mk4 import ux_login_countdown, ux_confirm, ux_dice_rolling, ux_render_words
     from ux_mk4 import ux_show_phish_words
-    q1_reword = lambda m: m
+    q1_reword = lambda m: m         # nothing to rename on Mk4
 
 class UserInteraction:
-    def __init__(self):
-        self.stack = []
+    # Stack of UX objects, held in preallocated slots so that push/pop
+    # don't resize anything. Depth is normally small.
+    def __init__(self, depth=8):
+        self.slots = [None] * depth
+        self.sp = -1                # index of top of stack
 
     def top_of_stack(self):
-        return self.stack[-1] if self.stack else None
+        return self.slots[self.sp] if self.sp >= 0 else None
 
     def reset(self, new_ux):
-        self.stack.clear()
-        gc.collect()
+        for i in range(self.sp+1):
+            self.slots[i] = None
+        self.sp = -1
+
+        # allocator will reclaim those when needed; only force it if already short
+        if gc.mem_free() < LOW_MEM_FREE:
+            gc.collect()
+
         self.push(new_ux)
 
     async def interact(self):
         # this is called inside a while(1) all the time
         # - execute top of stack item
         try:
-            await self.stack[-1].interact()
+            await self.slots[self.sp].interact()
         except AbortInteraction:
             pass
 
     def push(self, new_ux):
-        self.stack.append(new_ux)
+        self.sp += 1
+        if self.sp == len(self.slots):
+            # unusually deep; grow
+            self.slots.append(None)
+        self.slots[self.sp] = new_ux
 
     def replace(self, new_ux):
-        old = self.stack.pop()
-        del old
-        self.stack.append(new_ux)
+        self.slots[self.sp] = new_ux
+
+    def set_bottom(self, new_ux):
+        # replace the top-level menu, keep everything above it
+        self.slots[0] = new_ux
 
     def pop(self):
-        if len(self.stack) < 2:
+        if self.sp < 1:
             # top of stack, do nothing
             return True
 
-        old = self.stack.pop()
-        del old
+        self.slots[self.sp] = None
+        self.sp -= 1
 
     def parent_of(self, child_ux):
-        for n, x in enumerate(self.stack):
-            if x == child_ux and n:
-                return self.stack[n-1]
+        for n in range(1, self.sp+1):
+            if self.slots[n] == child_ux:
+                return self.slots[n-1]
         return None
 
 # Singleton. User interacts with this "menu" stack.
@@ -82,36 +136,22 @@ def ux_clear_keys(no_aborts=False):
     # flush any pending keypresses
     from glob import numpad
 
-    try:
-        while 1:
-            ch = numpad.get_nowait()
-
-            if not no_aborts and ch == numpad.ABORT_KEY:
-                raise AbortInteraction()
-
-    except QueueEmpty:
-        return
+    if numpad.drain() and not no_aborts:
+        raise AbortInteraction()
 
 async def ux_wait_keyup(expected=None, flush=False):
     # Wait for single keypress in 'expected' set, return it
     # no visual feedback, no escape
     # - can be canceled anytime, using wait_for_ms to create a timeout
     from glob import numpad
+    from numpad import NumpadEvents
 
     if flush:
         armed = False
     else:
         armed = numpad.key_pressed or False
 
-    while 1:
-        if numpad.empty():
-            await sleep_ms(5)
-            continue
-        ch = await numpad.get()
-
-        if ch == numpad.ABORT_KEY:
-            raise AbortInteraction()
-
+    async for ch in NumpadEvents(numpad):
         if len(ch) > 1:
             # multipress
             continue
@@ -168,6 +208,144 @@ def ux_poll_key():
     return ch
 
 
+class StoryLines:
+    # Word-wrapped lines of a story, made on demand for display.
+    # - keeps only the offset of each source line, and where its wrapped
+    #   lines start; wrapping is redone for the few lines on screen
+    # - indexable, with len(), like the list of lines it replaces
+    # - accepts a stream or string
+    def __init__(self, msg, title=None):
+        if title:
+            # kinda weak rendering but it works.
+            self.head = ['\x01' + title] + TITLE_PAD
+        else:
+            self.head = []
+
+        self.starts = array.array('L')      # offset of each source line
+        self.firsts = array.array('L')      # index of its first wrapped line
+        self.num_src = 0                    # source lines, w/o blanks at end
+        self.num_body = 0                   # wrapped lines, w/o blanks at end
+        self.num_wrapped = 0                # wrapped lines, so far
+        self.cache = {}                     # source line number => wrapped lines
+
+        self.is_file = hasattr(msg, 'readline')
+        if self.is_file:
+            # coming from in-memory file for larger messages
+            msg.seek(0)
+            while 1:
+                pos = msg.tell()
+                ln = msg.readline()
+                if not ln:
+                    break
+                if ln[-1] == '\n':
+                    ln = ln[:-1]
+
+                self._add(pos, q1_reword(ln))
+        else:
+            # simple string being shown
+            msg = q1_reword(msg)
+
+            # walk the lines in place, rather than split() into a big list first
+            pos = 0
+            while 1:
+                nl = msg.find('\n', pos)
+                if nl < 0:
+                    self._add(pos, msg[pos:])
+                    break
+
+                self._add(pos, msg[pos:nl])
+                pos = nl + 1
+
+        self.msg = msg
+
+        if not self.num_src:
+            # nothing to show: trim blank lines at end
+            while self.head and not self.head[-1]:
+                self.head.pop()
+
+        # add our own marker at the end
+        self.count = len(self.head) + self.num_body + 1
+
+    def _add(self, pos, ln):
+        # count how many lines this one will wrap into
+        self.starts.append(pos)
+        self.firsts.append(self.num_wrapped)
+
+        self.num_wrapped += word_wrap_count(ln, CH_PER_W)
+
+        if ln:
+            # blank lines only count once something follows them
+            self.num_src = len(self.starts)
+            self.num_body = self.num_wrapped
+
+    def _source(self, idx):
+        # one source line, unwrapped
+        msg = self.msg
+        pos = self.starts[idx]
+
+        if self.is_file:
+            msg.seek(pos)
+            ln = msg.readline()
+            if ln[-1:] == '\n':
+                ln = ln[:-1]
+            return q1_reword(ln)
+
+        nl = msg.find('\n', pos)
+        return msg[pos:nl] if nl >= 0 else msg[pos:]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, n):
+        if not (0 <= n < self.count):
+            raise IndexError
+
+        nh = len(self.head)
+        if n < nh:
+            return self.head[n]
+        if n == self.count - 1:
+            return 'EOT'
+
+        # find source line holding wrapped line n
+        n -= nh
+        firsts = self.firsts
+        lo, hi = 0, self.num_src - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if firsts[mid] <= n:
+                lo = mid
+            else:
+                hi = mid - 1
+
+        wrapped = self.cache.get(lo)
+        if wrapped is None:
+            if len(self.cache) >= STORY_H*2:
+                # only need what's on screen
+                self.cache.clear()
+            wrapped = tuple(word_wrap(self._source(lo), CH_PER_W))
+            self.cache[lo] = wrapped
+
+        return wrapped[n - firsts[lo]]
+
+# scrolling keys for ux_show_story
+_PG_DOWN = const(1)
+_PG_UP = const(2)
+_LN_DOWN = const(3)
+_LN_UP = const(4)
+_HOME = const(5)
+_END = const(6)
+_STORY_NAV = {
+    '9': _PG_DOWN, KEY_PAGE_DOWN: _PG_DOWN, KEY_DOWN: _PG_DOWN,
+    '7': _PG_UP, KEY_PAGE_UP: _PG_UP, KEY_UP: _PG_UP,
+    # line up/down only on Mk4; too slow w/ Q1's big screen
+    '8': _LN_DOWN,
+    '5': _LN_UP,
+    '0': _HOME, KEY_HOME: _HOME,
+    KEY_END: _END,
+}
+# other ways out of ux_show_story, unless strict_escape
+_STORY_EXITS = frozenset({ 'x', 'y', KEY_NFC, KEY_QR })
+
 async def ux_show_story(msg, title=None, escape=None, sensitive=False,
                         strict_escape=False, scrollbar=True, hint_icons=None):
     # show a big long string, and wait for XY to continue
@@ -175,97 +353,78 @@ async def ux_show_story(msg, title=None, escape=None, sensitive=False,
     # - can accept other chars to 'escape' as well.
     # - accepts a stream or string
     # - on Q, will show icons in top-right if hint_icons is provided
-    from glob import dis
+    from glob import dis, numpad
 
-    lines = []
-    if title:
-        # kinda weak rendering but it works.
-        lines.append('\x01' + title)
+    lines = StoryLines(msg, title)
 
-        if version.has_qwerty:
-            # big screen always needs blank after title
-            lines.append('')
+    # so that a single membership test works below
+    if not escape:
+        escape = ''
+    elif not isinstance(escape, str):
+        escape = frozenset(escape)
 
-    if hasattr(msg, 'readline'):
-        # coming from in-memory file for larger messages
-        msg.seek(0)
-        for ln in msg:
-            if ln[-1] == '\n': 
-                ln = ln[:-1]
-
-            ln = q1_reword(ln)
-
-            lines.extend(word_wrap(ln, CH_PER_W))
-    else:
-        # simple string being shown
-        msg = q1_reword(msg)
-
-        for ln in msg.split('\n'):
-            lines.extend(word_wrap(ln, CH_PER_W))
-
-    # trim blank lines at end, add our own marker
-    while not lines[-1]:
-        lines = lines[:-1]
-
-    lines.append('EOT')
+    # fixed from here on; locals are faster than global/len() lookups below
+    height = STORY_H
+    num_lines = len(lines)
+    last_top = max(0, num_lines - 2)
+    end_top = max(0, num_lines - (height//2))
 
     top = 0
     ch = None
     pr = PressRelease()
     while 1:
-        # redraw
-        dis.draw_story(lines[top:top+STORY_H], top, len(lines), sensitive, hint_icons=hint_icons)
+        # redraw, unless more scrolling is already queued up (ie. fast key taps)
+        if numpad.next_press() not in _STORY_NAV:
+            dis.draw_story(lines, top, height, num_lines, sensitive, hint_icons=hint_icons)
 
         # wait to do something
         ch = await pr.wait()
-        if escape and (ch in escape):
+        if ch in escape:
             # allow another way out for some usages
             return ch
-        elif ch == KEY_ENTER:
-            if not strict_escape:
-                return 'y'      # translate for Mk4 code
-        elif ch == KEY_CANCEL:
-            if not strict_escape:
-                return 'x'      # translate for Mk4 code
-        elif ch in 'xy':
-            if not strict_escape:
-                return ch
-        elif ch == KEY_END:
-            top = max(0, len(lines)-(STORY_H//2))
-        elif ch == '0' or ch == KEY_HOME:
-            top = 0
-        elif ch == '7' or ch == KEY_PAGE_UP or ch == KEY_UP:
-            top = max(0, top-STORY_H)
-        elif ch == '9' or ch == KEY_PAGE_DOWN or ch == KEY_DOWN:
-            top = min(len(lines)-2, top+STORY_H)
-        elif ch == '5':
-            # line up/down only on Mk4; too slow w/ Q1's big screen
+
+        act = _STORY_NAV.get(ch)
+        if act == _PG_DOWN:
+            top = min(last_top, top+height)
+        elif act == _PG_UP:
+            top = max(0, top-height)
+        elif act == _LN_DOWN:
+            top = min(last_top, top+1)
+        elif act == _LN_UP:
             top = max(0, top-1)
-        elif ch == '8':
-            top = min(len(lines)-2, top+1)
+        elif act == _HOME:
+            top = 0
+        elif act == _END:
+            top = end_top
         elif not strict_escape:
-            if ch in { KEY_NFC, KEY_QR }:
+            if ch == KEY_ENTER:
+                return 'y'      # translate for Mk4 code
+            elif ch == KEY_CANCEL:
+                return 'x'      # translate for Mk4 code
+            elif ch in _STORY_EXITS:
                 return ch
 
-        
 
 async def idle_logout():
     import glob
     from glob import settings
 
+    numpad = glob.numpad
+
     while not glob.hsm_active:
-        await sleep_ms(5000)
+        # they may have changed setting recently (or switched seeds, which
+        # reloads settings) so never sleep longer than IDLE_RECHECK before looking again
+        timeout = settings.get('idle_to', DEFAULT_IDLE_TIMEOUT)*1000        # ms
 
-        if not glob.numpad.last_event_time:
+        if not timeout:
+            # "Never"
+            await sleep_ms(IDLE_RECHECK)
             continue
 
-        now = utime.ticks_ms() 
-        dt = utime.ticks_diff(now, glob.numpad.last_event_time)
+        dt = utime.ticks_diff(utime.ticks_ms(), numpad.last_event_time)
+        remain = timeout - dt
 
-        # they may have changed setting recently
-        timeout = settings.get('idle_to', DEFAULT_IDLE_TIMEOUT)*1000        # ms
-
-        if timeout and dt > timeout:
+        if remain <= 0:
             # user has been idle for too long: do a logout
             print("Idle!")
 
@@ -273,6 +432,9 @@ async def idle_logout():
             await logout_now()
             return              # not reached
 
+        # keypresses only move the deadline, and don't wake us
+        await sleep_ms(min(remain, IDLE_RECHECK))
+
 
 async def ux_dramatic_pause(msg, seconds):
     from glob import dis, hsm_active
@@ -281,19 +443,38 @@ async def ux_dramatic_pause(msg, seconds):
         return
 
     # show a full-screen msg, with a dramatic pause + progress bar
-    n = seconds * 8
+    n = int(seconds * 8)
     dis.fullscreen(msg)
+    last = -1
     for i in range(n):
-        dis.progress_bar_show(i/n)
+        # only redraw if bar has grown by at least a pixel
+        px = (i * dis.WIDTH) // n
+        if px != last:
+            dis.progress_bar_show(i/n)
+            last = px
+
         await sleep_ms(125)
 
     ux_clear_keys()
 
+def _last_lines(msg, n):
+    # same as msg.split('\n')[-n:], but without splitting the whole thing
+    rv = []
+    end = len(msg)
+    while n and end >= 0:
+        i = msg.rfind('\n', 0, end)
+        rv.append(msg[i+1:end])
+        end = i
+        n -= 1
+
+    rv.reverse()
+    return rv
+
 def show_fatal_error(msg):
     # show a multi-line error message, over some kinda "fatal" banner
     from glob import dis
 
-    lines = msg.split('\n')[-6:]
+    lines = _last_lines(msg, 6)
     dis.show_yikes(lines)
 
 async def ux_aborted():
@@ -26,16 +26,20 @@ class PressRelease:
             rep_delay = 200 if not self.num_repeats else 20
             so_far = 0
 
-            while numpad.empty():
-                if self.last_key and numpad.key_pressed == self.last_key:
-                    if so_far >= rep_delay:
-                        self.num_repeats += 1
-                        return self.last_key
+            if not self.last_key:
+                # nothing held down that could repeat: sleep until next event
+                ch = await numpad.get()
+            else:
+                while numpad.empty():
+                    if numpad.key_pressed == self.last_key:
+                        if so_far >= rep_delay:
+                            self.num_repeats += 1
+                            return self.last_key
 
-                await sleep_ms(1)
-                so_far += 1
+                    await sleep_ms(1)
+                    so_far += 1
 
-            ch = numpad.get_nowait()
+                ch = numpad.get_nowait()
 
             if ch == numpad.ABORT_KEY:
                 raise AbortInteraction()
@@ -60,11 +64,14 @@ class PressRelease:
                 return ch
             
             
+# no title on Mk4, so goes in front of message; never needs q1_reword()
+SURE_PREFIX = "Are you SURE ?!?\n\n"
+
 async def ux_confirm(msg):
     # confirmation screen, with stock title and Y=of course.
     from ux import ux_show_story
 
-    resp = await ux_show_story("Are you SURE ?!?\n\n" + msg)
+    resp = await ux_show_story(SURE_PREFIX + msg)
 
     return resp == 'y'
 
@@ -36,21 +36,25 @@ class PressRelease:
             #  - these values approved by @nvk
             rep_delay = 20 if self.num_repeats else 200
 
-            # busy-wait on key arrivial
-            # - would like to use asyncio.wait_for_ms but causes random CancelledError's elsewhere
-            for i in range(rep_delay//2):
-                if not numpad.empty():
-                    break
-                await sleep_ms(2)
+            if not self.last_key:
+                # nothing held down that could repeat: sleep until next event
+                ch = await numpad.get()
+            else:
+                # busy-wait on key arrivial, so we can do key-repeat
+                # - would like to use asyncio.wait_for_ms but causes random CancelledError's elsewhere
+                for i in range(rep_delay//2):
+                    if not numpad.empty():
+                        break
+                    await sleep_ms(2)
 
-            if numpad.empty():
-                # nothing changed, do key repeat
-                if self.last_key and numpad.key_pressed == self.last_key:
-                    self.num_repeats += 1
-                    return self.last_key
-                continue
+                if numpad.empty():
+                    # nothing changed, do key repeat
+                    if numpad.key_pressed == self.last_key:
+                        self.num_repeats += 1
+                        return self.last_key
+                    continue
 
-            ch = numpad.get_nowait()
+                ch = numpad.get_nowait()
 
             if ch == numpad.ABORT_KEY:
                 raise AbortInteraction()
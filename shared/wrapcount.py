@@ -0,0 +1,58 @@
+# (c) Copyright 2026 by Coinkite Inc. This file is covered by license found in COPYING-CC.
+#
+# wrapcount.py - Native (viper) helper for utils.word_wrap_count()
+#
+# - kept apart from utils.py so builds without a native emitter can still
+#   import that, and fall back to pure python
+#
+import micropython
+
+@micropython.viper
+def wrap_count(buf: ptr8, n: int, w: int) -> int:
+    # Same line count as word_wrap(), for n bytes of plain printable ASCII.
+    # - returns -1 for anything else (double-wide, unicode, control chars)
+    i = 0
+    while i < n:
+        if buf[i] < 32 or buf[i] > 126:
+            return -1
+        i += 1
+
+    if n <= w:
+        return 1
+
+    count = 0
+    s = 0
+    while s < n:
+        # find a space in (width) first part of remainder
+        e = s + w - 1
+        if e > n:
+            e = n
+        sp = -1
+        i = e - 1
+        while i >= s:
+            if buf[i] == 32:
+                sp = i
+                break
+            i -= 1
+
+        if sp == -1:
+            # bad-break the line
+            sp = s + w
+            if sp > n:
+                sp = n
+            nsp = sp
+            if nsp < n and buf[nsp] == 32:
+                nsp += 1
+        else:
+            nsp = sp + 1
+
+        if (sp - s) + 1 + (n - nsp) <= w:
+            # rest fits on this line too
+            nsp = n
+
+        count += 1
+        s = nsp
+
+    return count
+
+# EOF
@@ -22,6 +22,9 @@ FROZEN_MANIFEST = \
 					boards/$(BOARD)/shared/manifest.py \
 					boards/$(BOARD)/shared/manifest_mk3.py
 
+# frozen native code (shared/wrapcount.py): mpy-cross must target this CPU
+MPY_CROSS_FLAGS += -march=armv7emsp
+
 # This will relocate things up by 32k=0x8000
 # see also ./layout.ld
 CFLAGS_MOD += -DVECT_TAB_OFFSET=0x8000
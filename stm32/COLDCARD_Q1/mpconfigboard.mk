@@ -24,6 +24,9 @@ FROZEN_MANIFEST =  \
 					boards/$(BOARD)/shared/manifest.py \
 					boards/$(BOARD)/shared/manifest_q1.py
 
+# frozen native code (shared/wrapcount.py): mpy-cross must target this CPU
+MPY_CROSS_FLAGS += -march=armv7emsp
+
 # This will relocate things up by 128k=0x2_0000
 # see also ./layout.ld
 CFLAGS_MOD += -DVECT_TAB_OFFSET=0x20000
@@ -295,6 +295,57 @@ def test_word_wrap(txt, x_line2, sim_exec, only_q1, width=34):
 
     assert want_words == got_words
 
+@pytest.mark.parametrize('txt', [
+    'short',
+    'The quick brown fox jumps over the lazy dog, many many times over.',   # ascii
+    'Disk, press \x0e to share via NFC, \x11 to share',      # double-wide: fallback
+    'tab\tin the middle of a line long enough to be wrapped',  # control char
+    'unicode → arrows ← need the slow path too, if long enough',
+    'x'*80,                                     # bad-break, no spaces
+    'abcdefghijklmnopqrstu vwxyz',              # bad-break then space
+    'trailing spaces at end of a longish line         ',
+    ' leading space and then a long run of words to wrap',
+    'a'*16, 'a'*17, 'a'*18, 'a'*33, 'a'*34, 'a'*35,      # width boundary
+    'a'*16 + ' b', 'a'*17 + ' b', 'a'*33 + ' b', 'a'*34 + ' b',
+])
+@pytest.mark.parametrize('width', [17, 34])
+def test_word_wrap_count(txt, width, sim_exec):
+    # fast line count must agree exactly with word_wrap(), else stories break
+    # - only meaningful if native helper is in use, else compares word_wrap to itself
+    rv = sim_exec('import utils, wrapcount; RV.write(repr(utils._wrap_count is not None))')
+    if 'Traceback' in rv:
+        pytest.skip('no native emitter: wrapcount not usable')
+    assert rv == 'True'
+
+    cmd = f'from utils import word_wrap, word_wrap_count; ' \
+          f'RV.write(repr((word_wrap_count({txt!r}, {width}), len(list(word_wrap({txt!r}, {width}))))))'
+    got = sim_exec(cmd)
+    assert 'Traceback' not in got
+
+    fast, slow = eval(got)
+    assert fast == slow
+
+@pytest.mark.parametrize('msg', [
+    ' X X ', '\nX X ', 'OKX ', 'X to abort', 'Press OK to go, X to abort.',
+    'a\nX X X b', '\n\nX OK\nX ', 'nothing to see', '',
+])
+def test_q1_reword(msg, sim_exec, only_q1):
+    # single-pass rewording must match the simple chain of replace() calls
+    want = msg.replace('\nX ', 'CANCEL ').replace(' X ', ' CANCEL ').replace('OK', 'ENTER')
+
+    got = sim_exec(f'from ux import q1_reword; RV.write(repr(q1_reword({msg!r})))')
+    assert 'Traceback' not in got
+    assert eval(got) == want
+
+@pytest.mark.parametrize('msg', [
+    '', 'one', 'a\nb', '\nleading', 'trailing\n', '\n\n\n',
+    '\n'.join('Traceback line %d' % i for i in range(20)),
+])
+def test_last_lines(msg, sim_exec):
+    # used by show_fatal_error, must match split('\n')[-6:]
+    got = sim_exec(f'from ux import _last_lines; RV.write(repr(_last_lines({msg!r}, 6)))')
+    assert eval(got) == msg.split('\n')[-6:]
+
 from constants import AF_P2WSH, AF_P2SH, AF_P2WSH_P2SH, AF_CLASSIC, AF_P2WPKH, AF_P2WPKH_P2SH
 
 @pytest.mark.parametrize('addr,net,fmt', [
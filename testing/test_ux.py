@@ -949,6 +949,83 @@ def test_custom_pushtx_url(goto_home, pick_menu_item, press_select, enter_comple
     assert settings_get('ptxurl', None) is None
 
 
+@pytest.fixture
+def show_story(sim_exec):
+    # put a story on top of the menu stack, as if some menu item did it
+    def doit(msg, as_file=False):
+        src = f'uio.StringIO({msg!r})' if as_file else repr(msg)
+        cmd = ('import ux, uio\n'
+               'class StoryTest:\n'
+               '    def __init__(self, m):\n'
+               '        self.m = m\n'
+               '    async def interact(self):\n'
+               '        import ux\n'
+               '        await ux.ux_show_story(self.m)\n'
+               '        ux.the_ux.pop()\n'
+               f'ux.abort_and_push(StoryTest({src}))\n')
+        rv = sim_exec(cmd)
+        assert 'Traceback' not in rv, rv
+        time.sleep(.1)
+
+    return doit
+
+@pytest.mark.parametrize('as_file', [False, True])
+def test_story_scroll(as_file, show_story, sim_exec, cap_story, cap_screen,
+                      need_keypress, press_cancel):
+    # long story, drawn on demand from string or file, while paging thru it
+    msg = '\n'.join('Line %02d' % i for i in range(40))
+    msg += '\n\n' + ' '.join('word%02d' % i for i in range(30)) + ' THEEND\n\n'
+
+    height = int(sim_exec('from ux import STORY_H; RV.write(str(STORY_H))'))
+
+    show_story(msg, as_file)
+    title, body = cap_story()
+    assert body == msg
+
+    scr = cap_screen()
+    assert 'Line 00' in scr
+    assert ('Line %02d' % height) not in scr
+
+    for pg in range(1, 40 // height):
+        need_keypress('9')
+        time.sleep(.05)
+        scr = cap_screen()
+        assert ('Line %02d' % (pg * height)) in scr
+        assert ('Line %02d' % (pg * height - 1)) not in scr
+
+    # keep going to the end, long last line is wrapped
+    for _ in range(20):
+        if 'THEEND' in cap_screen():
+            break
+        need_keypress('9')
+        time.sleep(.05)
+    else:
+        pytest.fail('never reached end of story')
+
+    need_keypress('0')
+    time.sleep(.05)
+    assert 'Line 00' in cap_screen()
+
+    press_cancel()
+    time.sleep(.1)
+    assert cap_story() == ('', '')
+
+def test_story_empty(show_story, cap_story, need_keypress, press_cancel):
+    # nothing to show, and no title: scrolling must not fail
+    show_story('')
+    assert cap_story() == ('NO-TITLE', '')
+
+    need_keypress('9')
+    need_keypress('8')
+    need_keypress('5')
+    time.sleep(.05)
+
+    # story still running, and can be left normally
+    assert cap_story() == ('NO-TITLE', '')
+    press_cancel()
+    time.sleep(.1)
+    assert cap_story() == ('', '')
+
 @pytest.mark.onetime
 def test_dump_menutree(sim_execfile):
     # saves to ../unix/work/menudump.txt